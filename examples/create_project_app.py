@@ -2,8 +2,6 @@ import json
 import os
 import sys
 
-import requests
-
 from zoltpy.connection import ZoltarConnection, Project
 
 
@@ -40,9 +38,7 @@ def create_project_app():
 
     # create new project
     print(f"creating new project. project name={project_dict['name']}")
-    response = requests.post(f'{conn.host}/api/projects/',
-                             headers={'Authorization': f'JWT {conn.session.token}'},
-                             json={'project_config': project_dict})
+    response = conn.http.post(f'{conn.host}/api/projects/', json={'project_config': project_dict})
     if response.status_code != 200:  # HTTP_200_OK
         raise RuntimeError(f"status_code was not 200. status_code={response.status_code}, text={response.text}")
 
@@ -1,12 +1,18 @@
 import base64
-import datetime
+import io
 import json
+import math
+import os
+import time
 import unittest
 from unittest import mock
 from unittest.mock import patch, MagicMock
 
+import requests
+
 from zoltpy.connection import ZoltarConnection, ZoltarSession, ZoltarResource, Project, Model, Unit, Target, TimeZero, \
-    Forecast, Job
+    Forecast, Job, BulkUploadError
+from zoltpy.csv_io import csv_rows_from_json_io_dict
 
 
 class ConnectionTestCase(unittest.TestCase):
@@ -19,7 +25,7 @@ class ConnectionTestCase(unittest.TestCase):
         username = 'Z_USERNAME'
         password = 'Z_PASSWORD'
         mock_authenticate(conn, username, password)
-        with patch('requests.post') as post_mock:
+        with patch('requests.Session.post') as post_mock:
             post_mock.return_value.status_code = 200
             post_mock.return_value.json = MagicMock(return_value={'token': MOCK_TOKEN})
             conn.authenticate(username, password)
@@ -27,27 +33,273 @@ class ConnectionTestCase(unittest.TestCase):
             self.assertEqual(password, conn.password)
             self.assertIsInstance(conn.session, ZoltarSession)
             self.assertEqual(MOCK_TOKEN, conn.session.token)
-            post_mock.assert_called_once_with('/api-token-auth/', {'username': 'Z_USERNAME', 'password': 'Z_PASSWORD'})
+            post_mock.assert_called_once_with('/api-token-auth/', {'username': 'Z_USERNAME', 'password': 'Z_PASSWORD'},
+                                              headers={'Authorization': None})
+
+
+    def test_authenticate_sets_session_headers(self):
+        with ZoltarConnection('http://example.com') as conn:
+            self.assertNotIn('Authorization', conn.http.headers)
+            mock_authenticate(conn)
+            self.assertEqual(f'JWT {MOCK_TOKEN}', conn.http.headers['Authorization'])
+            self.assertEqual('application/json; indent=4', conn.http.headers['Accept'])
+            self.assertIn('gzip', conn.http.headers['Accept-Encoding'])
+            retry = conn.http.get_adapter('https://example.com').max_retries
+            self.assertEqual(5, retry.total)
+            self.assertEqual(frozenset([429, 502, 503, 504]), frozenset(retry.status_forcelist))
+            self.assertNotIn('POST', retry.allowed_methods)  # non-idempotent: only connect errors are retried
+            self.assertFalse(retry.is_retry('POST', 503))
+            self.assertTrue(retry.is_retry('GET', 503))
+            self.assertFalse(retry.raise_on_status)
+        with patch('requests.Session.close') as close_mock:
+            with ZoltarConnection('http://example.com'):
+                pass
+            close_mock.assert_called_once()
+
+
+    def test_re_authenticate_updates_session_header(self):
+        conn = mock_authenticate(ZoltarConnection('http://example.com'))  # default token (mock_token) is expired
+        with patch('requests.Session.post') as post_mock:
+            post_mock.return_value.status_code = 200
+            post_mock.return_value.json = MagicMock(return_value={'token': 'new.token'})
+            with patch('zoltpy.connection.ZoltarSession._exp_for_token', return_value=None):
+                conn.re_authenticate_if_necessary()
+            self.assertEqual({'Authorization': None}, post_mock.call_args[1]['headers'])
+        self.assertEqual('JWT new.token', conn.http.headers['Authorization'])
+
+
+    def test_re_authenticate_keeps_session_header_during_token_post(self):
+        conn = mock_authenticate(ZoltarConnection('http://example.com'))
+        old_header = conn.http.headers['Authorization']
+        headers_during_post = []
+
+
+        def post_side_effect(*args, **kwargs):
+            headers_during_post.append(conn.http.headers.get('Authorization'))
+            return MagicMock(status_code=200, json=MagicMock(return_value={'token': 'new.token'}))
+
+
+        with patch('requests.Session.post', side_effect=post_side_effect), \
+                patch('zoltpy.connection.ZoltarSession._exp_for_token', return_value=None):
+            conn.re_authenticate_if_necessary()
+        self.assertEqual([old_header], headers_during_post)  # other threads' requests still carry a token
+        self.assertEqual('JWT new.token', conn.http.headers['Authorization'])
+
+
+    def test_id_is_parsed_once(self):
+        with patch('zoltpy.connection.ZoltarResource.id_for_uri', return_value=3) as id_for_uri_mock:
+            project = Project(ZoltarConnection('http://example.com'), 'http://example.com/api/project/3/')
+            self.assertEqual(3, project.id)
+            repr(project)
+            id_for_uri_mock.assert_called_once_with('http://example.com/api/project/3/')
 
 
     def test_id_for_uri(self):
         self.assertEqual(71, ZoltarResource.id_for_uri('http://example.com/api/forecast/71'))  # no trailing '/'
         self.assertEqual(71, ZoltarResource.id_for_uri('http://example.com/api/forecast/71/'))
+        self.assertEqual(71, ZoltarResource.id_for_uri('http://example.com/api/forecast/71//'))
+        self.assertEqual(71, ZoltarResource.id_for_uri('71/'))
+        with self.assertRaises(ValueError):
+            ZoltarResource.id_for_uri('http://example.com/api/forecast/')
+
+
+    def test_repr(self):
+        conn = ZoltarConnection('http://example.com')
+        self.assertEqual("('Project', 'http://example.com/api/project/3/', 3)",
+                         repr(Project(conn, 'http://example.com/api/project/3/')))
+        self.assertEqual("('Project', 'http://example.com/api/project/3/', 3, 'Docs Example Project', True)",
+                         repr(Project(conn, 'http://example.com/api/project/3/', PROJECTS_LIST_DICTS[0])))
+        self.assertEqual("('Model', 'http://example.com/api/model/5/', 5, 'docs forecast model')",
+                         repr(Model(conn, 'http://example.com/api/model/5/', MODELS_LIST_DICTS[0])))
+        self.assertEqual("('TimeZero', 'http://example.com/api/timezero/6/', 6, '2011-10-09')",  # falsy fields omitted
+                         repr(TimeZero(conn, 'http://example.com/api/timezero/6/', TIMEZEROS_LIST_DICTS[1])))
+        self.assertEqual("('Job', 'http://example.com/api/job/2/', 2, 'SUCCESS')",
+                         repr(Job(conn, 'http://example.com/api/job/2/', {'status': 4})))
 
 
     def test_json_for_uri_calls_re_authenticate_if_necessary(self):
         with patch('zoltpy.connection.ZoltarConnection.re_authenticate_if_necessary') as re_auth_mock, \
-                patch('requests.get') as get_mock:
+                patch('requests.Session.get') as get_mock:
             get_mock.return_value.status_code = 200
+            get_mock.return_value.content = b'[]'
             conn = mock_authenticate(ZoltarConnection('http://example.com'))
             conn.json_for_uri('/')
             re_auth_mock.assert_called_once()
 
 
+    def test_json_for_uri_cache(self):
+        conn = mock_authenticate(ZoltarConnection('http://example.com'))
+        uri = 'http://example.com/api/unit/23/'
+        with patch('requests.Session.get') as get_mock, \
+                patch('zoltpy.connection.ZoltarConnection.re_authenticate_if_necessary'):
+            get_mock.return_value.status_code = 200
+            get_mock.return_value.content = json.dumps(UNITS_LIST_DICTS[0]).encode()
+
+            # second GET of the same URI is served from the cache, including via a different instance
+            self.assertEqual(UNITS_LIST_DICTS[0], conn.json_for_uri(uri))
+            self.assertEqual('location1', Unit(conn, uri).name)
+            get_mock.assert_called_once()
+
+            # refresh() bypasses the cache
+            get_mock.reset_mock()
+            Unit(conn, uri).refresh()
+            get_mock.assert_called_once()
+
+            # expired entries are re-fetched
+            get_mock.reset_mock()
+            with patch('time.time', return_value=time.time() + 61):
+                conn.json_for_uri(uri)
+            get_mock.assert_called_once()
+
+            # on transient failure, the last good (even if expired) JSON is returned
+            get_mock.reset_mock()
+            get_mock.return_value.status_code = 503
+            with patch('time.time', return_value=time.time() + 122):
+                self.assertEqual(UNITS_LIST_DICTS[0], conn.json_for_uri(uri))
+            get_mock.assert_called_once()
+
+            get_mock.return_value.status_code = 429
+            with patch('time.time', return_value=time.time() + 122):
+                self.assertEqual(UNITS_LIST_DICTS[0], conn.json_for_uri(uri))
+
+            get_mock.side_effect = requests.exceptions.ConnectionError()
+            with patch('time.time', return_value=time.time() + 122):
+                self.assertEqual(UNITS_LIST_DICTS[0], conn.json_for_uri(uri))
+            get_mock.side_effect = None
+
+            # but client errors such as lost permissions or a deleted resource are not masked
+            for status_code in [401, 403, 404]:
+                get_mock.return_value.status_code = status_code
+                with patch('time.time', return_value=time.time() + 122), self.assertRaises(RuntimeError):
+                    conn.json_for_uri(uri)
+
+            # and refresh() never serves stale JSON
+            get_mock.return_value.status_code = 503
+            with self.assertRaises(RuntimeError):
+                Unit(conn, uri).refresh()
+
+            # but not once invalidated
+            conn.invalidate_cache(uri)
+            with self.assertRaises(RuntimeError):
+                conn.json_for_uri(uri)
+
+            # non-JSON requests are not cached
+            get_mock.reset_mock()
+            get_mock.return_value.status_code = 200
+            conn.json_for_uri(uri, False, 'text/csv')
+            conn.json_for_uri(uri, False, 'text/csv')
+            self.assertEqual(2, get_mock.call_count)
+
+
+    def test_json_for_uri_cache_evicts_least_recently_used(self):
+        conn = mock_authenticate(ZoltarConnection('http://example.com', cache_max_entries=2))
+        uri_to_json = {unit_json['url']: unit_json for unit_json in UNITS_LIST_DICTS}
+        uri_1, uri_2, uri_3 = list(uri_to_json)
+        with patch('requests.Session.get') as get_mock, \
+                patch('zoltpy.connection.ZoltarConnection.re_authenticate_if_necessary'):
+            get_mock.side_effect = lambda uri, headers: MagicMock(status_code=200, headers={},
+                                                                  content=json.dumps(uri_to_json[uri]).encode())
+            conn.json_for_uri(uri_1)
+            conn.json_for_uri(uri_2)
+            conn.json_for_uri(uri_1)  # a hit makes uri_1 the most recently used, so uri_2 is evicted next
+            conn.json_for_uri(uri_3)
+            self.assertEqual([uri_1, uri_3], list(conn._uri_cache))
+            self.assertEqual(3, get_mock.call_count)
+
+            # a 304 also counts as a use
+            get_mock.side_effect = None
+            get_mock.return_value.status_code = 304
+            conn.json_for_uri(uri_1, use_cache=False)
+            self.assertEqual([uri_3, uri_1], list(conn._uri_cache))
+
+
+    def test_json_loads(self):
+        from zoltpy.connection import _json_loads  # private
+
+
+        self.assertEqual({'a': [1.5, 2, 'x', True, None]}, _json_loads(b'{"a": [1.5, 2, "x", true, null]}'))
+        self.assertTrue(math.isnan(_json_loads(b'[NaN]')[0]))  # orjson rejects, json accepts
+        with patch('zoltpy.connection.orjson', None):
+            self.assertEqual({'a': 1}, _json_loads(b'{"a": 1}'))
+        with self.assertRaises(ValueError):
+            _json_loads(b'{')
+
+
+    def test_json_for_uri_conditional_get(self):
+        conn = mock_authenticate(ZoltarConnection('http://example.com'))
+        uri = 'http://example.com/api/job/2/'
+        with patch('requests.Session.get') as get_mock, \
+                patch('zoltpy.connection.ZoltarConnection.re_authenticate_if_necessary'):
+            get_mock.return_value.status_code = 200
+            get_mock.return_value.headers = {'ETag': '"v1"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+            get_mock.return_value.content = b'{"status": 2}'
+            job = Job(conn, uri)
+            self.assertEqual('QUEUED', job.status_as_str)
+            get_mock.assert_called_once_with(uri, headers=None)  # nothing cached yet
+
+            # refresh() revalidates. 304 -> cached JSON is kept
+            get_mock.reset_mock()
+            get_mock.return_value.status_code = 304
+            get_mock.return_value.content = b''
+            self.assertEqual({'status': 2}, job.refresh())
+            get_mock.assert_called_once_with(uri, headers={'If-None-Match': '"v1"',
+                                                           'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+
+            # changed -> new JSON and validators are cached
+            get_mock.reset_mock()
+            get_mock.return_value.status_code = 200
+            get_mock.return_value.headers = {'ETag': '"v2"'}
+            get_mock.return_value.content = b'{"status": 4}'
+            job.refresh()
+            self.assertEqual('SUCCESS', job.status_as_str)
+            self.assertEqual('"v2"', conn._uri_cache[uri][2])
+            self.assertIsNone(conn._uri_cache[uri][3])
+
+
+    def test_job_wait_until_done(self):
+        conn = mock_authenticate(ZoltarConnection('http://example.com'))
+        job_jsons = [{'status': 2, 'failure_message': ''}, {'status': 4, 'failure_message': ''}]
+        with patch('zoltpy.connection.ZoltarConnection.json_for_uri', side_effect=job_jsons) as json_for_uri_mock, \
+                patch('time.sleep') as sleep_mock:
+            job = Job(conn, 'http://example.com/api/job/2/')
+            statuses = []
+            self.assertIs(job, job.wait_until_done(poll_interval=5, status_callback=statuses.append))
+            self.assertEqual(2, json_for_uri_mock.call_count)
+            sleep_mock.assert_called_once_with(5)
+            self.assertEqual(['QUEUED', 'SUCCESS'], statuses)
+
+        job_jsons = [{'status': 5, 'failure_message': 'bad file'}]
+        with patch('zoltpy.connection.ZoltarConnection.json_for_uri', side_effect=job_jsons), \
+                patch('time.sleep'):
+            job = Job(conn, 'http://example.com/api/job/2/')
+            with self.assertRaises(RuntimeError) as context:
+                job.wait_until_done()
+            self.assertIn('bad file', str(context.exception))
+
+
+    def test_mutations_invalidate_cache(self):
+        conn = mock_authenticate(ZoltarConnection('http://example.com'))
+        project = Project(conn, 'http://example.com/api/project/3/', PROJECTS_LIST_DICTS[0])
+        conn._uri_cache.update({
+            'http://example.com/api/project/3/models/': (time.time(), MODELS_LIST_DICTS, None, None),
+            'http://example.com/api/project/3/units/': (time.time(), UNITS_LIST_DICTS, None, None)})
+        with patch('requests.Session.post') as post_mock, \
+                patch('requests.Session.delete') as delete_mock, \
+                patch('zoltpy.connection.ZoltarConnection.re_authenticate_if_necessary'):
+            post_mock.return_value.status_code = 200
+            post_mock.return_value.json = MagicMock(return_value=MODELS_LIST_DICTS[0])
+            project.create_model(dict(MODELS_LIST_DICTS[0], team_name='a team_name'))
+            self.assertEqual(['http://example.com/api/project/3/units/'], list(conn._uri_cache))
+
+            delete_mock.return_value.status_code = 204
+            project.delete()
+            self.assertEqual({}, conn._uri_cache)
+
+
     def test_delete_calls_re_authenticate_if_necessary(self):
         with patch('zoltpy.connection.ZoltarConnection.re_authenticate_if_necessary') as re_auth_mock, \
                 patch('zoltpy.connection.ZoltarConnection.json_for_uri') as json_for_uri_mock, \
-                patch('requests.delete') as delete_mock:
+                patch('requests.Session.delete') as delete_mock:
             json_for_uri_mock.return_value = PROJECTS_LIST_DICTS
             delete_mock.return_value.status_code = 200
             conn = mock_authenticate(ZoltarConnection('http://example.com'))
@@ -144,13 +396,127 @@ class ConnectionTestCase(unittest.TestCase):
         self.assertEqual("docs-predictions.json", forecast_0.source)
 
 
+    def test_prefetch(self):
+        conn = mock_authenticate(ZoltarConnection('http://example.com'))
+        units = [Unit(conn, unit_json['url']) for unit_json in UNITS_LIST_DICTS]
+        with patch('zoltpy.async_io.json_for_uris', return_value=UNITS_LIST_DICTS) as json_for_uris_mock, \
+                patch('zoltpy.connection.ZoltarConnection.re_authenticate_if_necessary'), \
+                patch('zoltpy.connection.ZoltarConnection.json_for_uri') as json_for_uri_mock:
+            self.assertEqual(units, conn.prefetch(units))
+            json_for_uris_mock.assert_called_once_with([unit_json['url'] for unit_json in UNITS_LIST_DICTS],
+                                                       MOCK_TOKEN)
+            self.assertEqual(['location1', 'location2', 'location3'], [unit.name for unit in units])
+            json_for_uri_mock.assert_not_called()
+
+        # a generator, e.g., from an iter_*() method
+        units = [Unit(conn, unit_json['url']) for unit_json in UNITS_LIST_DICTS]
+        with patch('zoltpy.async_io.json_for_uris', return_value=UNITS_LIST_DICTS), \
+                patch('zoltpy.connection.ZoltarConnection.re_authenticate_if_necessary'), \
+                patch('zoltpy.connection.ZoltarConnection.json_for_uri') as json_for_uri_mock:
+            self.assertEqual(units, conn.prefetch(unit for unit in units))
+            self.assertEqual(['location1', 'location2', 'location3'], [unit.name for unit in units])
+            json_for_uri_mock.assert_not_called()
+
+
+    def test_json_for_uris_in_running_event_loop(self):
+        import asyncio
+        from zoltpy.async_io import json_for_uris
+
+
+        async def gather_json(uris, token, limit):
+            return [{'url': uri} for uri in uris]
+
+
+        async def notebook_cell():  # e.g., Jupyter, which runs cells in an event loop
+            return json_for_uris(['http://example.com/api/unit/23/'], MOCK_TOKEN)
+
+
+        loop = asyncio.new_event_loop()
+        try:
+            with patch('zoltpy.async_io._gather_json', side_effect=gather_json):
+                self.assertEqual([{'url': 'http://example.com/api/unit/23/'}], json_for_uris(  # no running loop
+                    ['http://example.com/api/unit/23/'], MOCK_TOKEN))
+                self.assertEqual([{'url': 'http://example.com/api/unit/23/'}],
+                                 loop.run_until_complete(notebook_cell()))
+        finally:
+            loop.close()
+
+
+    def test_fetch_many_and_models_eager(self):
+        conn = mock_authenticate(ZoltarConnection('http://example.com'))
+        uri_to_json = {unit_json['url']: unit_json for unit_json in UNITS_LIST_DICTS}
+        with patch('zoltpy.connection.ZoltarConnection.json_for_uri', side_effect=uri_to_json.get), \
+                patch('zoltpy.connection.ZoltarConnection.re_authenticate_if_necessary') as re_auth_mock:
+            self.assertEqual(uri_to_json, conn.fetch_many(list(uri_to_json)))
+            re_auth_mock.assert_called_once()
+            self.assertEqual(uri_to_json, conn.fetch_many(uri for uri in uri_to_json))  # e.g., from an iter_*()
+
+        model_detail_json = dict(MODELS_LIST_DICTS[0], team_name='team 1')
+        uri_to_json = {'http://example.com/api/project/3/models/': MODELS_LIST_DICTS,
+                       model_detail_json['url']: model_detail_json}
+        project = Project(conn, 'http://example.com/api/project/3/')
+        with patch('zoltpy.connection.ZoltarConnection.json_for_uri', side_effect=uri_to_json.get) as json_uri_mock, \
+                patch('zoltpy.connection.ZoltarConnection.re_authenticate_if_necessary'):
+            models = project.models_eager()
+            self.assertEqual(1, len(models))
+            self.assertIsInstance(models[0], Model)
+            json_uri_mock.reset_mock()
+            self.assertEqual('team 1', models[0].team_name)
+            json_uri_mock.assert_not_called()
+
+
+    def test_forecasts_for_all_models(self):
+        conn = mock_authenticate(ZoltarConnection('http://example.com'))
+        project = Project(conn, 'http://example.com/api/project/3/')
+        with patch('zoltpy.async_io.json_for_uris', return_value=[FORECASTS_LIST_DICTS]) as json_for_uris_mock, \
+                patch('zoltpy.connection.ZoltarConnection.re_authenticate_if_necessary'), \
+                patch('zoltpy.connection.ZoltarConnection.json_for_uri', return_value=MODELS_LIST_DICTS):
+            model_to_forecasts = project.forecasts_for_all_models()
+            json_for_uris_mock.assert_called_once_with(['http://example.com/api/model/5/forecasts/'], MOCK_TOKEN)
+            self.assertEqual(1, len(model_to_forecasts))
+            model, forecasts = list(model_to_forecasts.items())[0]
+            self.assertIsInstance(model, Model)
+            self.assertEqual(1, len(forecasts))
+            self.assertIsInstance(forecasts[0], Forecast)
+            self.assertEqual("docs-predictions.json", forecasts[0].source)
+
+
+    @mock.patch('zoltpy.connection.ZoltarConnection.json_for_uri')
+    def test_iter_resources(self, json_for_uri_mock):
+        conn = ZoltarConnection('http://example.com')
+        project = Project(conn, 'http://example.com/api/project/3/', PROJECTS_LIST_DICTS[0])
+        for iter_fcn_name, list_dicts, resource_class, list_uri in [
+            ('iter_models', MODELS_LIST_DICTS, Model, 'http://example.com/api/project/3/models/'),
+            ('iter_units', UNITS_LIST_DICTS, Unit, 'http://example.com/api/project/3/units/'),
+            ('iter_targets', TARGETS_LIST_DICTS, Target, 'http://example.com/api/project/3/targets/'),
+            ('iter_timezeros', TIMEZEROS_LIST_DICTS, TimeZero, 'http://example.com/api/project/3/timezeros/')]:
+            json_for_uri_mock.reset_mock()
+            json_for_uri_mock.return_value = list_dicts
+            resources_gen = getattr(project, iter_fcn_name)()
+            json_for_uri_mock.assert_not_called()  # lazy
+
+            resources = list(resources_gen)
+            json_for_uri_mock.assert_called_once_with(list_uri)
+            self.assertEqual(len(list_dicts), len(resources))
+            self.assertTrue(all(isinstance(resource, resource_class) for resource in resources))
+            self.assertEqual([resource_json['url'] for resource_json in list_dicts],
+                             [resource.uri for resource in resources])
+
+        json_for_uri_mock.reset_mock()
+        json_for_uri_mock.return_value = FORECASTS_LIST_DICTS
+        model = Model(conn, 'http://example.com/api/model/5/', MODELS_LIST_DICTS[0])
+        forecasts = list(model.iter_forecasts())
+        json_for_uri_mock.assert_called_once_with('http://example.com/api/model/5/forecasts/')
+        self.assertIsInstance(forecasts[0], Forecast)
+
+
     @mock.patch('zoltpy.connection.ZoltarConnection.json_for_uri')
     def test_upload_truth_data(self, json_for_uri_mock):
         conn = mock_authenticate(ZoltarConnection('http://example.com'))
         project = Project(conn, 'http://example.com/api/project/3/')
         with open('tests/job-2.json') as ufj_fp, \
                 open('tests/docs-ground-truth.csv') as csv_fp, \
-                patch('requests.post') as post_mock, \
+                patch('requests.Session.post') as post_mock, \
                 patch('zoltpy.connection.ZoltarConnection.re_authenticate_if_necessary') as re_auth_mock:
             job_json = json.load(ufj_fp)
             post_mock.return_value.status_code = 200
@@ -168,7 +534,7 @@ class ConnectionTestCase(unittest.TestCase):
         conn = mock_authenticate(ZoltarConnection('http://example.com'))
         with open('tests/job-2.json') as ufj_fp, \
                 open("examples/example-model-config.json") as fp, \
-                patch('requests.post') as post_mock, \
+                patch('requests.Session.post') as post_mock, \
                 patch('zoltpy.connection.ZoltarConnection.re_authenticate_if_necessary') as re_auth_mock:
             job_json = json.load(ufj_fp)
             model_config = json.load(fp)
@@ -184,10 +550,48 @@ class ConnectionTestCase(unittest.TestCase):
             self.assertEqual(job_json['url'], act_job_json.uri)
 
 
+    @mock.patch('zoltpy.connection.ZoltarConnection.json_for_uri')
+    def test_upload_forecasts_bulk(self, json_for_uri_mock):
+        conn = mock_authenticate(ZoltarConnection('http://example.com'))
+        forecast_model = Model(conn, 'http://example.com/api/model/5/', MODELS_LIST_DICTS[0])
+        with open('tests/job-2.json') as ufj_fp, \
+                patch('requests.Session.post') as post_mock, \
+                patch('zoltpy.connection.ZoltarConnection.re_authenticate_if_necessary'):
+            job_json = json.load(ufj_fp)
+            post_mock.return_value.status_code = 200
+            post_mock.return_value.json = MagicMock(return_value=job_json)
+            items = [({}, f'source-{idx}.csv', f'2011-10-0{idx}') for idx in range(1, 4)] + \
+                    [({}, 'source-4.csv', '2011-10-04', 'some notes')]
+            jobs = forecast_model.upload_forecasts_bulk(items)
+            self.assertEqual(4, post_mock.call_count)
+            self.assertEqual(4, len(jobs))
+            self.assertTrue(all(isinstance(job, Job) for job in jobs))
+            self.assertEqual({(item[2], item[3] if len(item) == 4 else '') for item in items},
+                             {(call[1]['data']['timezero_date'], call[1]['data']['notes'])
+                              for call in post_mock.call_args_list})
+
+            # a failed upload doesn't lose the others' Jobs
+            def post_side_effect(*args, **kwargs):
+                status_code = 400 if kwargs['data']['timezero_date'] == '2011-10-02' else 200
+                return MagicMock(status_code=status_code, text='bad timezero', json=MagicMock(return_value=job_json))
+
+
+            post_mock.reset_mock()
+            post_mock.side_effect = post_side_effect
+            with self.assertRaises(BulkUploadError) as context:
+                forecast_model.upload_forecasts_bulk(items)
+            self.assertEqual(4, post_mock.call_count)  # every item was attempted
+            self.assertEqual([True, False, True, True], [isinstance(job, Job) for job in context.exception.jobs])
+            self.assertEqual([1], list(context.exception.errors))
+            self.assertIsInstance(context.exception, RuntimeError)
+            self.assertIn("1 of 4 uploads failed", str(context.exception))
+            self.assertIn("source='source-2.csv'", str(context.exception))
+
+
     def test_create_timezero(self):
         conn = mock_authenticate(ZoltarConnection('http://example.com'))
         with patch('zoltpy.connection.ZoltarConnection.json_for_uri', return_value=PROJECTS_LIST_DICTS), \
-             patch('requests.post') as post_mock, \
+             patch('requests.Session.post') as post_mock, \
                 patch('zoltpy.connection.ZoltarConnection.re_authenticate_if_necessary') as re_auth_mock:
             project = conn.projects[0]
             post_mock.return_value.status_code = 200
@@ -215,7 +619,7 @@ class ConnectionTestCase(unittest.TestCase):
         project = conn.projects[0]
 
         with open('tests/job-submit-query.json') as job_submit_json_fp, \
-                patch('requests.post') as post_mock, \
+                patch('requests.Session.post') as post_mock, \
                 patch('zoltpy.connection.ZoltarConnection.re_authenticate_if_necessary'):
             # test submit
             query = {}  # all forecasts
@@ -247,7 +651,7 @@ class ConnectionTestCase(unittest.TestCase):
         project = conn.projects[0]
 
         with open('tests/job-submit-query.json') as job_submit_json_fp, \
-                patch('requests.post') as post_mock, \
+                patch('requests.Session.post') as post_mock, \
                 patch('zoltpy.connection.ZoltarConnection.re_authenticate_if_necessary'):
             # test submit
             query = {}  # all forecasts
@@ -277,11 +681,10 @@ class ConnectionTestCase(unittest.TestCase):
             model_config = json.load(fp)
 
         # case: blue sky
-        with patch('requests.put') as put_mock:
+        with patch('requests.Session.put') as put_mock:
             put_mock.return_value.status_code = 200
             model_0.edit(model_config)
-            put_mock.assert_called_once_with('http://example.com/api/model/5/', json={'model_config': model_config},
-                                             headers={'Authorization': f'JWT {MOCK_TOKEN}'})
+            put_mock.assert_called_once_with('http://example.com/api/model/5/', json={'model_config': model_config})
 
 
     @mock.patch('zoltpy.connection.ZoltarConnection.json_for_uri')
@@ -291,7 +694,7 @@ class ConnectionTestCase(unittest.TestCase):
             model_config['url'] = 'http://example.com/api/model/5/'
         conn = mock_authenticate(ZoltarConnection('http://example.com'))
         project = Project(conn, 'http://example.com/api/project/3/')
-        with patch('requests.post') as post_mock, \
+        with patch('requests.Session.post') as post_mock, \
                 patch('zoltpy.connection.ZoltarConnection.re_authenticate_if_necessary') as re_auth_mock:
             post_mock.return_value.status_code = 200
             post_mock.return_value.json = MagicMock(return_value=model_config)
@@ -301,13 +704,27 @@ class ConnectionTestCase(unittest.TestCase):
             self.assertIsInstance(new_model, Model)
             re_auth_mock.assert_called_once()
 
+            # optional keys may be omitted, but required ones may not
+            post_mock.reset_mock()
+            for optional_key in ['contributors', 'license', 'notes', 'citation', 'methods']:
+                del model_config[optional_key]
+            project.create_model(model_config)
+            post_mock.assert_called_once()
+
+            post_mock.reset_mock()
+            del model_config['team_name']
+            with self.assertRaises(RuntimeError) as context:
+                project.create_model(model_config)
+            self.assertIn("missing required keys: ['team_name']", str(context.exception))
+            post_mock.assert_not_called()
+
 
     def test_forecasts_set_source(self):
         from tests.test_util import FORECAST_DICT  # avoid circular imports
 
 
         conn = mock_authenticate(ZoltarConnection('http://example.com'))  # default token (mock_token) is expired
-        with patch('requests.put') as put_mock, \
+        with patch('requests.Session.put') as put_mock, \
                 patch('zoltpy.connection.ZoltarConnection.re_authenticate_if_necessary') as re_auth_mock, \
                 patch('zoltpy.connection.ZoltarConnection.json_for_uri') as json_for_uri_mock:
             put_mock.return_value.status_code = 200
@@ -323,6 +740,56 @@ class ConnectionTestCase(unittest.TestCase):
             self.assertEqual(new_source, forecast.source)
 
 
+    def test_forecast_data(self):
+        conn = mock_authenticate(ZoltarConnection('http://example.com'))
+        forecast = Forecast(conn, 'http://example.com/api/forecast/3/', FORECASTS_LIST_DICTS[0])
+        with open('tests/docs-predictions.json', 'rb') as fp:
+            json_bytes = fp.read()
+        exp_json_io_dict = json.loads(json_bytes)
+
+        # case: data()
+        with patch('requests.Session.get') as get_mock:
+            get_mock.return_value.status_code = 200
+            get_mock.return_value.raw = io.BytesIO(json_bytes)
+            self.assertEqual(exp_json_io_dict, forecast.data())
+            get_mock.assert_called_once_with('http://example.com/api/forecast/3/data/', stream=True)
+            get_mock.return_value.close.assert_called_once()
+
+        # case: iter_predictions()
+        with patch('requests.Session.get') as get_mock:
+            get_mock.return_value.status_code = 200
+            get_mock.return_value.raw = io.BytesIO(json_bytes)
+            self.assertEqual(exp_json_io_dict['predictions'], list(forecast.iter_predictions()))
+
+        # case: csv_rows_stream()
+        with patch('requests.Session.get') as get_mock:
+            get_mock.return_value.status_code = 200
+            get_mock.return_value.raw = io.BytesIO(json_bytes)
+            act_rows = forecast.csv_rows_stream()
+            get_mock.assert_not_called()  # lazy
+            self.assertEqual(csv_rows_from_json_io_dict(exp_json_io_dict), [list(row) for row in act_rows])
+            get_mock.return_value.close.assert_called_once()
+
+        # case: no predictions section. the streamed paths fail like csv_rows_from_json_io_dict() does
+        with patch('requests.Session.get') as get_mock:
+            get_mock.return_value.status_code = 200
+            get_mock.return_value.raw = io.BytesIO(b'{"meta": {}}')
+            with self.assertRaises(RuntimeError) as context:
+                list(forecast.csv_rows_stream())
+            self.assertIn('no predictions section found', str(context.exception))
+            get_mock.return_value.close.assert_called_once()
+
+            get_mock.return_value.raw = io.BytesIO(b'{"meta": {}, "predictions": []}')
+            self.assertEqual([], list(forecast.iter_predictions()))
+
+        # case: bad status
+        with patch('requests.Session.get') as get_mock:
+            get_mock.return_value.status_code = 404
+            with self.assertRaises(RuntimeError) as context:
+                forecast.data()
+            self.assertIn('status code was not 200', str(context.exception))
+
+
     def test_is_token_expired(self):
         # test an expired token
         conn = mock_authenticate(ZoltarConnection('http://example.com'))  # default token (mock_token) is expired
@@ -334,7 +801,7 @@ class ConnectionTestCase(unittest.TestCase):
         old_signature = token_split[1]
 
         # round to exclude decimal portion - throws off some JWT tools:
-        ten_min_from_now = round((datetime.datetime.utcnow() + datetime.timedelta(minutes=10)).timestamp())
+        ten_min_from_now = round(time.time() + 10 * 60)
         new_payload = {'user_id': 3, 'username': 'model_owner1', 'exp': ten_min_from_now, 'email': ''}
         new_payload_json = json.dumps(new_payload)
         payload_b64 = base64.b64encode(new_payload_json.encode('utf_8'))
@@ -343,6 +810,47 @@ class ConnectionTestCase(unittest.TestCase):
         self.assertFalse(conn.session.is_token_expired())
 
 
+    def test_is_token_expired_margin_and_missing_exp(self):
+        conn = mock_authenticate(ZoltarConnection('http://example.com'))
+        self.assertEqual(1558442805, conn.session.token_exp)  # cached from MOCK_TOKEN's payload
+        header, _, signature = MOCK_TOKEN.split('.')
+
+        # a token that expires within the safety margin is treated as expired
+        ten_sec_from_now = round(time.time() + 10)
+        payload_b64 = base64.urlsafe_b64encode(json.dumps({'exp': ten_sec_from_now}).encode('utf_8')).decode('utf-8')
+        conn.session.token = f"{header}.{payload_b64.rstrip('=')}.{signature}"
+        self.assertEqual(ten_sec_from_now, conn.session.token_exp)
+        self.assertTrue(conn.session.is_token_expired())
+
+        # a token with no 'exp' field is treated as expired
+        payload_b64 = base64.urlsafe_b64encode(json.dumps({'user_id': 3}).encode('utf_8')).decode('utf-8')
+        conn.session.token = f"{header}.{payload_b64}.{signature}"
+        self.assertIsNone(conn.session.token_exp)
+        self.assertTrue(conn.session.is_token_expired())
+
+
+    @unittest.skipUnless(hasattr(time, 'tzset'), "requires time.tzset()")
+    def test_is_token_expired_non_utc_timezone(self):
+        conn = mock_authenticate(ZoltarConnection('http://example.com'))
+        header, _, signature = MOCK_TOKEN.split('.')
+        old_tz = os.environ.get('TZ')
+        try:
+            for tz in ['America/New_York', 'Asia/Tokyo', 'UTC']:
+                os.environ['TZ'] = tz
+                time.tzset()
+                for exp_offset, is_exp_expired in [(60 * 60, False), (-60 * 60, True)]:
+                    payload = json.dumps({'exp': round(time.time() + exp_offset)}).encode('utf_8')
+                    payload_b64 = base64.urlsafe_b64encode(payload).decode('utf-8')
+                    conn.session.token = f"{header}.{payload_b64}.{signature}"
+                    self.assertEqual(is_exp_expired, conn.session.is_token_expired(), (tz, exp_offset))
+        finally:
+            if old_tz is None:
+                os.environ.pop('TZ', None)
+            else:
+                os.environ['TZ'] = old_tz
+            time.tzset()
+
+
 #
 # mock_authenticate()
 #
@@ -359,7 +867,7 @@ MOCK_TOKEN = "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9.eyJ1c2VyX2lkIjozLCJ1c2VybmFtZ
 
 
 def mock_authenticate(conn, username='', password=''):
-    with patch('requests.post') as post_mock:
+    with patch('requests.Session.post') as post_mock:
         post_mock.return_value.status_code = 200
         post_mock.return_value.json = MagicMock(return_value={'token': MOCK_TOKEN})
         conn.authenticate(username, password)
@@ -1,7 +1,12 @@
+import csv
+import io
 import json
 from unittest import TestCase
 
-from zoltpy.csv_io import csv_rows_from_json_io_dict
+import pandas as pd
+
+from zoltpy.csv_io import csv_rows_from_json_io_dict, csv_rows_from_prediction_dicts, write_csv_from_json_io_dict, \
+    csv_dataframe_from_json_io_dict
 
 
 class CsvIOTestCase(TestCase):
@@ -90,3 +95,35 @@ class CsvIOTestCase(TestCase):
             json_io_dict = json.load(fp)
             act_rows = csv_rows_from_json_io_dict(json_io_dict)
         self.assertEqual(exp_rows, act_rows)
+
+        # same rows from a (one-shot) iterator over just the predictions
+        self.assertEqual(exp_rows, csv_rows_from_prediction_dicts(iter(json_io_dict['predictions'])))
+
+
+    def test_write_csv_from_json_io_dict(self):
+        with open('tests/docs-predictions.json') as fp:
+            json_io_dict = json.load(fp)
+        exp_string_io = io.StringIO()
+        csv.writer(exp_string_io).writerows(csv_rows_from_json_io_dict(json_io_dict))
+
+        act_string_io = io.StringIO()
+        write_csv_from_json_io_dict(act_string_io, json_io_dict)
+        self.assertEqual(exp_string_io.getvalue(), act_string_io.getvalue())
+
+        with self.assertRaises(RuntimeError) as context:
+            write_csv_from_json_io_dict(io.StringIO(), {'meta': {}})
+        self.assertIn('no predictions section found', str(context.exception))
+
+
+    def test_csv_dataframe_from_json_io_dict(self):
+        with self.assertRaises(RuntimeError) as context:
+            csv_dataframe_from_json_io_dict({'meta': {'targets': []}, 'predictions': [{'class': 'InvalidClass'}]})
+        self.assertIn('invalid prediction_dict class', str(context.exception))
+
+        with open('tests/docs-predictions.json') as fp:
+            json_io_dict = json.load(fp)
+        exp_rows = csv_rows_from_json_io_dict(json_io_dict)
+        act_df = csv_dataframe_from_json_io_dict(json_io_dict)
+        self.assertEqual(exp_rows[0], list(act_df.columns))
+        self.assertEqual(exp_rows[1:], act_df.values.tolist())
+        pd.testing.assert_frame_equal(pd.DataFrame(exp_rows[1:], columns=exp_rows[0]), act_df)
@@ -1,9 +1,11 @@
+import io
+from contextlib import redirect_stdout
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 
 from tests.test_connection import PROJECTS_LIST_DICTS, mock_authenticate
-from zoltpy.connection import ZoltarConnection
-from zoltpy.util import delete_forecast, download_forecast
+from zoltpy.connection import ZoltarConnection, Project, Job
+from zoltpy.util import busy_poll_job, create_project, delete_forecast, download_forecast
 
 
 class UtilTestCase(TestCase):
@@ -14,8 +16,6 @@ class UtilTestCase(TestCase):
     - create_project():
       - no existing project
       - calls existing_project.delete()
-      - POSTs '{conn.host}/api/projects/'
-      - returns a Project()
     - delete_model():
       - no existing project
       - no existing model
@@ -39,6 +39,47 @@ class UtilTestCase(TestCase):
     """
 
 
+    def test_create_project(self):
+        conn = mock_authenticate(ZoltarConnection('http://example.com'))
+        with patch('zoltpy.connection.ZoltarConnection.json_for_uri', return_value=[]), \
+                patch('requests.Session.post') as post_mock, \
+                patch('zoltpy.connection.ZoltarConnection.re_authenticate_if_necessary'):
+            post_mock.return_value.status_code = 200
+            post_mock.return_value.json = MagicMock(return_value=PROJECTS_LIST_DICTS[0])
+            project = create_project(conn, 'examples/docs-project.json')
+            post_mock.assert_called_once()
+            self.assertEqual('http://example.com/api/projects/', post_mock.call_args[0][0])
+            self.assertNotIn('headers', post_mock.call_args[1])  # Authorization comes from the session
+            self.assertIsInstance(project, Project)
+            self.assertEqual(PROJECTS_LIST_DICTS[0]['url'], project.uri)
+
+
+    def test_busy_poll_job(self):
+        conn = mock_authenticate(ZoltarConnection('http://example.com'))
+        job_jsons = [{'status': 2, 'failure_message': ''}, {'status': 5, 'failure_message': 'bad file'}]
+        with patch('zoltpy.connection.ZoltarConnection.json_for_uri', side_effect=job_jsons), \
+                patch('time.sleep') as sleep_mock, \
+                redirect_stdout(io.StringIO()) as stdout:
+            with self.assertRaises(RuntimeError) as context:
+                busy_poll_job(Job(conn, 'http://example.com/api/job/2/'))
+            self.assertIn('bad file', str(context.exception))
+            sleep_mock.assert_called_once_with(1)
+        self.assertEqual(['- QUEUED', '- FAILED', 'x FAILED', ' bad file'],
+                         [line for line in stdout.getvalue().splitlines() if line and not line.startswith('*')])
+
+        # errors from polling itself are passed through as-is, without claiming that the job failed
+        poll_error = RuntimeError("json_for_uri(): status code was not 200")
+        with patch('zoltpy.connection.ZoltarConnection.json_for_uri',
+                   side_effect=[{'status': 2, 'failure_message': ''}, poll_error]), \
+                patch('time.sleep'), \
+                redirect_stdout(io.StringIO()) as stdout:
+            with self.assertRaises(RuntimeError) as context:
+                busy_poll_job(Job(conn, 'http://example.com/api/job/2/'))
+            self.assertIs(poll_error, context.exception)
+        self.assertEqual(['- QUEUED'],
+                         [line for line in stdout.getvalue().splitlines() if line and not line.startswith('*')])
+
+
     def test_download_forecast(self):
         def json_for_uri_mock_side_effect(*args, **kwargs):  # returns a sequence of return args
             return {'http://example.com/api/projects/': PROJECTS_LIST_DICTS,
@@ -0,0 +1,73 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
+
+from zoltpy.connection import _json_loads
+
+
+logger = logging.getLogger(__name__)
+
+
+#
+# This file defines asyncio-based helpers for fetching many resource URLs concurrently. It is used by
+# ZoltarConnection.prefetch() and friends, and requires the optional aiohttp package.
+#
+
+def json_for_uris(uris, token, limit=32):
+    """
+    Synchronous entry point that GETs all of `uris` concurrently and returns their JSON. NB: If called from a thread
+    that's already running an event loop (e.g., a Jupyter notebook cell), the fetching is done on a new loop in a
+    worker thread, because a loop cannot be run inside another one. The calling loop is blocked until all the URIs
+    have been fetched.
+
+    :param uris: a list of resource URLs to GET
+    :param token: a JWT token as returned by ZoltarSession
+    :param limit: maximum number of simultaneous connections
+    :return: a list of JSON dicts (or lists), in the same order as `uris`
+    """
+    if _is_event_loop_running():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(_run_gather_json, uris, token, limit).result()
+
+    return _run_gather_json(uris, token, limit)
+
+
+def _is_event_loop_running():
+    """
+    :return: True if the current thread is running an event loop
+    """
+    try:
+        asyncio.get_running_loop()  # python 3.7+
+        return True
+    except RuntimeError:  # no running loop
+        return False
+    except AttributeError:  # python 3.6
+        return asyncio.get_event_loop().is_running()
+
+
+def _run_gather_json(uris, token, limit):
+    loop = asyncio.new_event_loop()  # NB: not asyncio.run() so that we work in python 3.6
+    try:
+        return loop.run_until_complete(_gather_json(uris, token, limit))
+    finally:
+        loop.close()
+
+
+async def _gather_json(uris, token, limit):
+    connector = aiohttp.TCPConnector(limit=limit)
+    headers = {'Authorization': f'JWT {token}', 'Accept': 'application/json; indent=4'}
+    async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+        return await asyncio.gather(*[_get_json(session, uri) for uri in uris])
+
+
+async def _get_json(session, uri):
+    logger.debug(f"_get_json(): {uri!r}")
+    async with session.get(uri) as response:
+        if response.status != 200:  # HTTP_200_OK
+            text = await response.text()
+            raise RuntimeError(f"_get_json(): status code was not 200. uri={uri}, status_code={response.status}. "
+                               f"text={text}")
+
+        return _json_loads(await response.read())
@@ -4,14 +4,47 @@ import datetime
 import json
 import logging
 import tempfile
+import threading
+import time
 from abc import ABC
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
+import ijson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+from zoltpy.csv_io import iter_csv_rows_from_prediction_dicts
+
+try:
+    import orjson  # optional. parses large responses several times faster than the json module
+except ImportError:
+    orjson = None
 
 
 logger = logging.getLogger(__name__)
 
 
+# keys that Project.create_model()'s model_config must have. others ('contributors', 'license', 'notes', 'citation',
+# 'methods') are optional
+_REQUIRED_MODEL_KEYS = frozenset({'name', 'abbreviation', 'team_name', 'description', 'home_url', 'aux_data_url'})
+
+
+def _json_loads(content):
+    """
+    Parses the passed response bytes, using orjson if it's installed. Falls back to the json module for the few inputs
+    that orjson rejects but json accepts, such as NaN.
+    """
+    if orjson:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
 def _basic_str(obj):
     """
     Handy for writing quick and dirty __str__() implementations.
@@ -19,6 +52,47 @@ def _basic_str(obj):
     return obj.__class__.__name__ + ': ' + obj.__repr__()
 
 
+class _RecordingReader:  # internal use
+    """
+    A binary file-like object that reads from another one, keeping a copy of the chunks read until stop() is called.
+    """
+
+
+    def __init__(self, fp):
+        self.fp = fp
+        self.chunks = []  # None once stopped
+
+
+    def read(self, size=-1):
+        chunk = self.fp.read(size)
+        if self.chunks is not None:
+            self.chunks.append(chunk)
+        return chunk
+
+
+    def stop(self):
+        self.chunks = None
+
+
+class BulkUploadError(RuntimeError):
+    """
+    Raised by Model.upload_forecasts_bulk() when one or more of its uploads failed. The others were still uploaded, so
+    `jobs` has their Jobs for tracking them, and retrying should only re-upload the failed items.
+
+    - jobs: a list with an item for each of the passed items, in order: the upload's Job if it succeeded, or None if
+      it failed
+    - errors: a dict that maps the index of each failed item to the exception it raised
+    """
+
+
+    def __init__(self, items, jobs, errors):
+        self.jobs = jobs
+        self.errors = errors
+        failures = ', '.join(f"{idx}: source={items[idx][1]!r}, timezero_date={items[idx][2]!r}, error={error!r}"
+                             for idx, error in errors.items())
+        super().__init__(f"upload_forecasts_bulk(): {len(errors)} of {len(items)} uploads failed. {failures}")
+
+
 class ZoltarConnection:
     """
     Represents a connection to a Zoltar server. This is an object-oriented interface that may be best suited to zoltpy
@@ -30,16 +104,54 @@ class ZoltarConnection:
     Notes:
     - This implementation uses the simple approach of caching the JSON response for resource URLs, but doesn't
       automatically handle their becoming stale, hence the need to call ZoltarResource.refresh().
+    - In addition, json_for_uri() keeps a connection-wide cache of JSON by URI that is reused for `cache_ttl` seconds,
+      so that different instances for the same resource don't each hit the API. The cache holds at most
+      `cache_max_entries` URIs, evicting the least recently used. Operations that change the server
+      invalidate the affected URIs, and ZoltarResource.refresh() always bypasses the cache. Cached URIs are revalidated
+      via conditional GETs (If-None-Match/If-Modified-Since), so an unchanged resource costs only a 304 Not Modified.
+    - All HTTP requests go through a single requests.Session (`self.http`) so that TCP and TLS connections are pooled
+      and reused across calls. The session's Authorization header is set by authenticate(). Call close() (or use the
+      instance as a context manager) to release the pooled connections.
     """
 
 
-    def __init__(self, host='https://zoltardata.com'):
+    # size of the pool of connections kept per host by `self.http`. concurrent requests should not exceed this
+    POOL_MAXSIZE = 20
+
+
+    def __init__(self, host='https://zoltardata.com', cache_ttl=60, cache_max_entries=1000):
         """
         :param host: URL of the Zoltar host. should *not* have a trailing '/'
+        :param cache_ttl: number of seconds that json_for_uri() reuses a URI's JSON. 0 disables caching
+        :param cache_max_entries: maximum number of URIs whose JSON json_for_uri() keeps. the least recently used URI
+            is evicted to make room for a new one
         """
         self.host = host
         self.username, self.password = None, None
         self.session = None
+        # maps URI -> (time.time() when cached, JSON, ETag header, Last-Modified header). least recently used first
+        self._uri_cache = OrderedDict()
+        self._cache_ttl = cache_ttl
+        self._cache_max_entries = cache_max_entries
+        self._cache_lock = threading.Lock()  # guards _uri_cache, which is shared by, e.g., fetch_many()'s threads
+        self._auth_lock = threading.Lock()  # serializes re-authentication among threads, e.g., fetch_many()
+        self.http = requests.Session()
+        # retry connection errors and transient "try again" statuses with exponential backoff, so that a flaky load
+        # balancer doesn't fail a whole script. POST is deliberately not in allowed_methods: the server may have
+        # received (and acted on) a POST that then failed with a read error or 5xx, and replaying it would create
+        # duplicates, e.g., forecast uploads. urllib3 still retries connect errors for every method because no request
+        # was sent. raise_on_status=False: once retries are exhausted, the last response is returned so that our usual
+        # status_code checks report it. non-retryable statuses (e.g., 4xx) are returned immediately
+        retry = Retry(total=5, backoff_factor=0.3, status_forcelist=(429, 502, 503, 504),
+                      allowed_methods=frozenset(['GET', 'PUT', 'DELETE']), respect_retry_after_header=True,
+                      raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=ZoltarConnection.POOL_MAXSIZE, max_retries=retry)
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+        # advertise every compression we can decode (gzip, deflate, and br if a brotli package is installed). large
+        # downloads such as forecast data compress well
+        self.http.headers.update({'Accept': 'application/json; indent=4',
+                                  'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding']})
 
 
     def __repr__(self):
@@ -50,15 +162,41 @@ class ZoltarConnection:
         return _basic_str(self)
 
 
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+    def close(self):
+        """
+        Closes my requests.Session, releasing its pooled connections.
+        """
+        self.http.close()
+
+
     def authenticate(self, username, password):
+        """
+        Gets a new token and sets my session's Authorization header to it. NB: My session's headers are changed only by
+        a single assignment once the token is in hand, so that requests made concurrently by other threads are never
+        sent without an Authorization header.
+        """
         self.username, self.password = username, password
-        self.session = ZoltarSession(self)
+        session = ZoltarSession(self)
+        self.http.headers['Authorization'] = f'JWT {session.token}'
+        self.session = session
 
 
     def re_authenticate_if_necessary(self):
-        if self.session.is_token_expired():
-            logger.debug(f"re_authenticate_if_necessary(): re-authenticating expired token. host={self.host}")
-            self.authenticate(self.username, self.password)
+        if not self.session.is_token_expired():
+            return
+
+        with self._auth_lock:
+            if self.session.is_token_expired():  # another thread may have re-authenticated while we waited
+                logger.debug(f"re_authenticate_if_necessary(): re-authenticating expired token. host={self.host}")
+                self.authenticate(self.username, self.password)
 
 
     @property
@@ -72,33 +210,173 @@ class ZoltarConnection:
         return [Project(self, project_json['url'], project_json) for project_json in projects_json_list]
 
 
-    def json_for_uri(self, uri, is_return_json=True, accept='application/json; indent=4'):
+    def json_for_uri(self, uri, is_return_json=True, accept='application/json; indent=4', use_cache=True):
+        """
+        :param uri: the URI to GET
+        :param is_return_json: True if the response's JSON should be returned. o/w the response itself is returned, and
+            the cache is not used
+        :param accept: the Accept header to send
+        :param use_cache: False if the cache's TTL should be ignored, i.e., the server is always asked (the fresh JSON
+            is still cached, and a cached entry is still revalidated rather than re-downloaded if the server supports
+            it). if True and the GET fails transiently - a network error, a 5xx, or 429 (too many requests) - the last
+            cached JSON is returned, however old, rather than raising. other failures (e.g., 401, 403, 404) always raise
+        :return: the JSON for uri, or the response if not is_return_json
+        """
         logger.debug(f"json_for_uri(): {uri!r}")
         if not self.session:
             raise RuntimeError("json_for_uri(): no session. uri={uri}")
 
+        cached = self._cache_get(uri) if is_return_json else None
+        if use_cache and cached and (time.time() - cached[0] < self._cache_ttl):
+            return cached[1]
+
+        headers = {} if accept == self.http.headers['Accept'] else {'Accept': accept}
+        if cached and cached[2]:
+            headers['If-None-Match'] = cached[2]
+        if cached and cached[3]:
+            headers['If-Modified-Since'] = cached[3]
         self.re_authenticate_if_necessary()
-        response = requests.get(uri, headers={'Accept': accept,
-                                              'Authorization': 'JWT {}'.format(self.session.token)})
+        try:
+            response = self.http.get(uri, headers=headers or None)
+        except requests.exceptions.RequestException as rex:
+            if use_cache and cached:
+                logger.warning(f"json_for_uri(): GET failed. returning stale JSON. uri={uri}, error={rex!r}")
+                return cached[1]
+
+            raise
+
+        if cached and (response.status_code == 304):  # HTTP_304_NOT_MODIFIED
+            self._cache_put(uri, (time.time(),) + cached[1:])
+            return cached[1]
+
         if response.status_code != 200:  # HTTP_200_OK
+            if use_cache and cached and ((response.status_code >= 500) or (response.status_code == 429)):
+                logger.warning(f"json_for_uri(): status code was not 200. returning stale JSON. uri={uri}, "
+                               f"status_code={response.status_code}")
+                return cached[1]
+
             raise RuntimeError(f"json_for_uri(): status code was not 200. uri={uri},"
                                f"status_code={response.status_code}. text={response.text}")
 
-        return response.json() if is_return_json else response
+        if not is_return_json:
+            return response
+
+        response_json = _json_loads(response.content)
+        if self._cache_ttl:
+            self._cache_put(uri, (time.time(), response_json, response.headers.get('ETag'),
+                                  response.headers.get('Last-Modified')))
+        return response_json
+
+
+    def fetch_many(self, uris, max_workers=16):
+        """
+        A thread-based alternative to prefetch() that GETs the JSON for many URIs concurrently via json_for_uri(),
+        sharing my pooled session. Does not require aiohttp.
+
+        :param uris: an iterable of URIs to GET
+        :param max_workers: number of threads to use. should not exceed POOL_MAXSIZE
+        :return: a dict that maps each URI in uris to its JSON
+        """
+        if not self.session:
+            raise RuntimeError("fetch_many(): no session")
+
+        uris = list(uris)  # we iterate twice below, so a generator would be used up by the first pass
+
+        self.re_authenticate_if_necessary()  # once up front. threads that find it expired later are serialized
+        with ThreadPoolExecutor(max_workers=min(max_workers, ZoltarConnection.POOL_MAXSIZE)) as executor:
+            return dict(zip(uris, executor.map(self.json_for_uri, uris)))
+
+
+    def invalidate_cache(self, *uris):
+        """
+        Removes the passed URIs from json_for_uri()'s cache, or the entire cache if none are passed.
+        """
+        with self._cache_lock:
+            if not uris:
+                self._uri_cache.clear()
+            for uri in uris:
+                self._uri_cache.pop(uri, None)
+
+
+    def _cache_get(self, uri):
+        """
+        :return: uri's cache entry (marking it as the most recently used), or None if not cached
+        """
+        with self._cache_lock:
+            cached = self._uri_cache.get(uri)
+            if cached:
+                self._uri_cache.move_to_end(uri)
+            return cached
+
+
+    def _cache_put(self, uri, cached):
+        """
+        Sets uri's cache entry to `cached`, marking it as the most recently used and evicting the least recently used
+        entries beyond `cache_max_entries`.
+        """
+        with self._cache_lock:
+            self._uri_cache[uri] = cached
+            self._uri_cache.move_to_end(uri)
+            while len(self._uri_cache) > self._cache_max_entries:
+                self._uri_cache.popitem(last=False)
+
+
+    def prefetch(self, resources):
+        """
+        Concurrently GETs the JSON for all of the passed ZoltarResources and caches it in each, so that subsequent
+        property accesses do not each hit the API serially. Requires the optional aiohttp package. Safe to call from
+        a running event loop (e.g., Jupyter), but blocks it - see `async_io.json_for_uris()`.
+
+        :param resources: an iterable of ZoltarResources, e.g., from Project.iter_models()
+        :return: a list of the resources
+        """
+        from zoltpy.async_io import json_for_uris  # optional dependency (aiohttp)
+
+
+        if not self.session:
+            raise RuntimeError("prefetch(): no session")
+
+        resources = list(resources)  # we iterate twice below, so a generator would be used up by the first pass
+        self.re_authenticate_if_necessary()
+        for resource, resource_json in zip(resources, json_for_uris([resource.uri for resource in resources],
+                                                                    self.session.token)):
+            resource._json = resource_json
+        return resources
 
 
 class ZoltarSession:  # internal use
 
+    # seconds before a token's actual expiration that we consider it expired, so that a token doesn't expire while a
+    # request is in flight
+    EXPIRATION_MARGIN_SECONDS = 30
+
+
     def __init__(self, zoltar_connection):
         super().__init__()
         self.zoltar_connection = zoltar_connection
         self.token = self._get_token()
 
 
+    @property
+    def token(self):
+        return self._token
+
+
+    @token.setter
+    def token(self, token):
+        """
+        Sets my token and caches its payload's "exp" field so that is_token_expired() need not decode it every call.
+        """
+        self._token = token
+        self.token_exp = ZoltarSession._exp_for_token(token)
+
+
     def _get_token(self):
-        response = requests.post(self.zoltar_connection.host + '/api-token-auth/',
-                                 {'username': self.zoltar_connection.username,
-                                  'password': self.zoltar_connection.password})
+        # headers: a None value drops the session's (possibly stale) Authorization header from this request only
+        response = self.zoltar_connection.http.post(self.zoltar_connection.host + '/api-token-auth/',
+                                                    {'username': self.zoltar_connection.username,
+                                                     'password': self.zoltar_connection.password},
+                                                    headers={'Authorization': None})
         if response.status_code != 200:  # HTTP_200_OK
             raise RuntimeError(f"get_token(): status code was not 200. status_code={response.status_code}. "
                                f"text={response.text}")
@@ -108,19 +386,33 @@ class ZoltarSession:  # internal use
 
     def is_token_expired(self):
         """
-        Details: based on how Zoltar implements JWT, we determine expiration by comparing the current datetime to the
-        token's payload's "exp" field. its value is a POSIX timestamp of a UTC date and time as returned by
-        datetime.utcnow().timestamp() - https://docs.python.org/3.6/library/datetime.html#datetime.datetime.utcnow
+        Details: based on how Zoltar implements JWT, we determine expiration by comparing the current time to the
+        token's payload's "exp" field. its value is a POSIX timestamp, so we compare it to time.time(), which is
+        independent of the local timezone. The token is treated as expired EXPIRATION_MARGIN_SECONDS early, and also if
+        it has no "exp" field.
 
         :return: True if my token is expired, and False if still valid
         """
-        return self.token_expiration_date().timestamp() <= datetime.datetime.utcnow().timestamp()
+        return (self.token_exp is None) or \
+               (time.time() >= self.token_exp - ZoltarSession.EXPIRATION_MARGIN_SECONDS)
 
 
     def token_expiration_date(self):
-        # # returns a POSIXct for the zoltar_session's token. see notes in is_token_expired() for details on extracting the date
+        """
+        :return: a datetime for my token's expiration. see notes in is_token_expired() for details
+        """
+        return datetime.datetime.utcfromtimestamp(self.token_exp)  # naive UTC datetime
+
 
-        token_split = self.token.split('.')  # 3 parts: header, payload, signature
+    @classmethod
+    def _exp_for_token(cls, token):
+        """
+        :return: the "exp" field of token's payload, or None if it has none (or token is None)
+        """
+        if not token:
+            return None
+
+        token_split = token.split('.')  # 3 parts: header, payload, signature
         payload_encoded = token_split[1]
 
         # per https://stackoverflow.com/questions/2941995/python-ignore-incorrect-padding-error-when-base64-decoding/49459036
@@ -128,11 +420,9 @@ class ZoltarSession:  # internal use
         if missing_padding:
             payload_encoded += '=' * (4 - missing_padding)
 
-        payload_decoded = base64.b64decode(payload_encoded)
+        payload_decoded = base64.urlsafe_b64decode(payload_encoded)  # JWT uses the URL-safe alphabet
         payload = json.loads(payload_decoded)
-        timestamp_utc = payload['exp']
-        exp_timestamp_date = datetime.datetime.utcfromtimestamp(timestamp_utc)
-        return exp_timestamp_date
+        return payload.get('exp')
 
 
 class ZoltarResource(ABC):
@@ -147,6 +437,8 @@ class ZoltarResource(ABC):
     - Newly-created instances do *not* refresh by default, for efficiency.
     """
 
+    _repr_keys = ()  # names of my JSON's fields that __repr__() includes. subclasses override
+
 
     def __init__(self, zoltar_connection, uri, initial_json=None):
         """
@@ -156,6 +448,7 @@ class ZoltarResource(ABC):
         """
         self.zoltar_connection = zoltar_connection
         self.uri = uri  # *does* include trailing slash
+        self._id = ZoltarResource.id_for_uri(uri)  # parsed once here b/c `id` is used by __repr__(), etc.
         self._json = initial_json  # cached JSON is None if not yet touched. can become stale
         # NB: no self.refresh() call!
 
@@ -165,17 +458,16 @@ class ZoltarResource(ABC):
         A default __repr__() that does not hit the API unless my _json has been cached, in which case my _repr_keys
         class var is used to determine which properties to return.
         """
-        repr_keys = getattr(self, '_repr_keys', None)
-        repr_list = [self.__class__.__name__, self.uri, self.id]
-        if repr_keys and self._json:
-            repr_list.extend([self._json[repr_key] for repr_key in repr_keys
-                              if repr_key in self._json and self._json[repr_key]])
-        return str(tuple(repr_list))
+        if not self._json:
+            return str((self.__class__.__name__, self.uri, self.id))
+
+        return str((self.__class__.__name__, self.uri, self.id) +
+                   tuple(self._json[repr_key] for repr_key in self._repr_keys if self._json.get(repr_key)))
 
 
     @property
     def id(self):  # todo rename to not conflict with `id` builtin
-        return ZoltarResource.id_for_uri(self.uri)
+        return self._id
 
 
     @classmethod
@@ -183,8 +475,7 @@ class ZoltarResource(ABC):
         """
         :return: the trailing integer id from a url structured like: "http://example.com/api/forecast/71/" -> 71L
         """
-        url_split = [split for split in uri.split('/') if split]  # drop any empty components, mainly from end
-        return int(url_split[-1])
+        return int(uri.rstrip('/').rpartition('/')[2])  # no intermediate list of all components
 
 
     @property
@@ -192,21 +483,35 @@ class ZoltarResource(ABC):
         """
         :return: my json as a dict, refreshing if none cached yet
         """
-        return self._json if self._json else self.refresh()
+        if not self._json:
+            self._json = self.zoltar_connection.json_for_uri(self.uri)
+        return self._json
 
 
     def refresh(self):
-        self._json = self.zoltar_connection.json_for_uri(self.uri)
+        """
+        Re-GETs my JSON, bypassing the connection's cache.
+        """
+        self._json = self.zoltar_connection.json_for_uri(self.uri, use_cache=False)
         return self._json
 
 
+    def _iter_resources(self, list_uri, resource_class):
+        """
+        Helper that GETs list_uri once and then lazily yields a resource_class for each item, passing the item's JSON
+        as initial_json.
+        """
+        for resource_json in self.zoltar_connection.json_for_uri(list_uri):
+            yield resource_class(self.zoltar_connection, resource_json['url'], resource_json)
+
+
     def delete(self):
         self.zoltar_connection.re_authenticate_if_necessary()
-        response = requests.delete(self.uri, headers={'Accept': 'application/json; indent=4',
-                                                      'Authorization': f'JWT {self.zoltar_connection.session.token}'})
+        response = self.zoltar_connection.http.delete(self.uri)
         if (response.status_code != 200) and (response.status_code != 204):  # HTTP_200_OK, HTTP_204_NO_CONTENT
             raise RuntimeError(f'delete_resource(): status code was not 204: {response.status_code}. {response.text}')
 
+        self.zoltar_connection.invalidate_cache()  # all, b/c I may be in any number of cached lists and sub-resources
         return response
 
 
@@ -230,38 +535,102 @@ class Project(ZoltarResource):
     @property
     def models(self):
         """
+        NB: Will be deprecated in favor of iter_models(), which does not construct all Models up front.
+
+        :return: a list of the Project's Models
+        """
+        return list(self.iter_models())
+
+
+    def iter_models(self):
+        """
+        :return: a generator of the Project's Models
+        """
+        return self._iter_resources(self.uri + 'models/', Model)
+
+
+    def models_eager(self):
+        """
+        The same as `models`, but each Model's JSON is fetched concurrently up front (see
+        ZoltarConnection.fetch_many()) so that accessing them later does not hit the API.
+
         :return: a list of the Project's Models
         """
         models_json_list = self.zoltar_connection.json_for_uri(self.uri + 'models/')
-        return [Model(self.zoltar_connection, model_json['url'], model_json) for model_json in models_json_list]
+        uri_to_json = self.zoltar_connection.fetch_many([model_json['url'] for model_json in models_json_list])
+        return [Model(self.zoltar_connection, model_json['url'], uri_to_json[model_json['url']])
+                for model_json in models_json_list]
 
 
     @property
     def units(self):
         """
+        NB: Will be deprecated in favor of iter_units(), which does not construct all Units up front.
+
         :return: a list of the Project's Units
         """
-        units_json_list = self.zoltar_connection.json_for_uri(self.uri + 'units/')
-        return [Unit(self.zoltar_connection, unit_json['url'], unit_json) for unit_json in units_json_list]
+        return list(self.iter_units())
+
+
+    def iter_units(self):
+        """
+        :return: a generator of the Project's Units
+        """
+        return self._iter_resources(self.uri + 'units/', Unit)
 
 
     @property
     def targets(self):
         """
+        NB: Will be deprecated in favor of iter_targets(), which does not construct all Targets up front.
+
         :return: a list of the Project's Targets
         """
-        targets_json_list = self.zoltar_connection.json_for_uri(self.uri + 'targets/')
-        return [Target(self.zoltar_connection, target_json['url'], target_json) for target_json in targets_json_list]
+        return list(self.iter_targets())
+
+
+    def iter_targets(self):
+        """
+        :return: a generator of the Project's Targets
+        """
+        return self._iter_resources(self.uri + 'targets/', Target)
 
 
     @property
     def timezeros(self):
         """
+        NB: Will be deprecated in favor of iter_timezeros(), which does not construct all TimeZeros up front.
+
         :return: a list of the Project's TimeZeros
         """
-        timezeros_json_list = self.zoltar_connection.json_for_uri(self.uri + 'timezeros/')
-        return [TimeZero(self.zoltar_connection, timezero_json['url'], timezero_json)
-                for timezero_json in timezeros_json_list]
+        return list(self.iter_timezeros())
+
+
+    def iter_timezeros(self):
+        """
+        :return: a generator of the Project's TimeZeros
+        """
+        return self._iter_resources(self.uri + 'timezeros/', TimeZero)
+
+
+    def forecasts_for_all_models(self):
+        """
+        Gets all of my Models' Forecasts, fetching each Model's forecast list concurrently. Requires the optional
+        aiohttp package. Safe to call from a running event loop (e.g., Jupyter), but blocks it - see
+        `async_io.json_for_uris()`.
+
+        :return: a dict that maps each of my Models to a list of its Forecasts
+        """
+        from zoltpy.async_io import json_for_uris  # optional dependency (aiohttp)
+
+
+        models = self.models
+        self.zoltar_connection.re_authenticate_if_necessary()
+        forecasts_json_lists = json_for_uris([model.uri + 'forecasts/' for model in models],
+                                             self.zoltar_connection.session.token)
+        return {model: [Forecast(self.zoltar_connection, forecast_json['url'], forecast_json)
+                        for forecast_json in forecasts_json_list]
+                for model, forecasts_json_list in zip(models, forecasts_json_lists)}
 
 
     @property
@@ -305,13 +674,12 @@ class Project(ZoltarResource):
         :return: a Job to use to track the upload
         """
         self.zoltar_connection.re_authenticate_if_necessary()
-        response = requests.post(self.uri + 'truth/',
-                                 headers={'Authorization': f'JWT {self.zoltar_connection.session.token}'},
-                                 files={'data_file': truth_csv_fp})
+        response = self.zoltar_connection.http.post(self.uri + 'truth/', files={'data_file': truth_csv_fp})
         if response.status_code != 200:  # HTTP_200_OK
             raise RuntimeError(f"upload_truth_data(): status code was not 200. status_code={response.status_code}. "
                                f"text={response.text}")
 
+        self.zoltar_connection.invalidate_cache(self.uri + 'truth/')
         job_json = response.json()
         return Job(self.zoltar_connection, job_json['url'])
 
@@ -321,17 +689,20 @@ class Project(ZoltarResource):
         Creates a forecast Model with the passed configuration.
 
         :param model_config: a dict used to initialize the new model. it must contain these fields: ['name',
-            'abbreviation', 'team_name', 'description', 'contributors', 'license', 'notes', 'citation', 'methods',
-            'home_url', 'aux_data_url']
+            'abbreviation', 'team_name', 'description', 'home_url', 'aux_data_url'], and may contain these:
+            ['contributors', 'license', 'notes', 'citation', 'methods']
         :return: a Model
         """
+        if not model_config.keys() >= _REQUIRED_MODEL_KEYS:  # dict_keys compares as a set without copying
+            missing_keys = sorted(_REQUIRED_MODEL_KEYS - model_config.keys())
+            raise RuntimeError(f"create_model(): model_config was missing required keys: {missing_keys}")
+
         self.zoltar_connection.re_authenticate_if_necessary()
-        response = requests.post(f'{self.uri}models/',
-                                 headers={'Authorization': f'JWT {self.zoltar_connection.session.token}'},
-                                 json={'model_config': model_config})
+        response = self.zoltar_connection.http.post(f'{self.uri}models/', json={'model_config': model_config})
         if response.status_code != 200:  # HTTP_200_OK
             raise RuntimeError(f"status_code was not 200. status_code={response.status_code}, text={response.text}")
 
+        self.zoltar_connection.invalidate_cache(self.uri + 'models/')
         new_model_json = response.json()
         return Model(self.zoltar_connection, new_model_json['url'], new_model_json)
 
@@ -356,12 +727,11 @@ class Project(ZoltarResource):
         if is_season_start:
             timezero_config['season_name'] = season_name
         self.zoltar_connection.re_authenticate_if_necessary()
-        response = requests.post(f'{self.uri}timezeros/',
-                                 headers={'Authorization': f'JWT {self.zoltar_connection.session.token}'},
-                                 json={'timezero_config': timezero_config})
+        response = self.zoltar_connection.http.post(f'{self.uri}timezeros/', json={'timezero_config': timezero_config})
         if response.status_code != 200:  # HTTP_200_OK
             raise RuntimeError(f"status_code was not 200. status_code={response.status_code}, text={response.text}")
 
+        self.zoltar_connection.invalidate_cache(self.uri + 'timezeros/')
         new_timezero_json = response.json()
         return TimeZero(self.zoltar_connection, new_timezero_json['url'], new_timezero_json)
 
@@ -387,9 +757,8 @@ class Project(ZoltarResource):
         :return: a Job for the query
         """
         self.zoltar_connection.re_authenticate_if_necessary()
-        response = requests.post(self.uri + ('forecast_queries/' if is_forecast_query else 'scores_queries/'),
-                                 headers={'Authorization': f'JWT {self.zoltar_connection.session.token}'},
-                                 json={'query': query})
+        response = self.zoltar_connection.http.post(
+            self.uri + ('forecast_queries/' if is_forecast_query else 'scores_queries/'), json={'query': query})
         job_json = response.json()
         if response.status_code != 200:
             raise RuntimeError(f"error submitting query: {job_json['error']}")
@@ -467,11 +836,18 @@ class Model(ZoltarResource):
     @property
     def forecasts(self):
         """
+        NB: Will be deprecated in favor of iter_forecasts(), which does not construct all Forecasts up front.
+
         :return: a list of this Model's Forecasts
         """
-        forecasts_json_list = self.zoltar_connection.json_for_uri(self.uri + 'forecasts/')
-        return [Forecast(self.zoltar_connection, forecast_json['url'], forecast_json)
-                for forecast_json in forecasts_json_list]
+        return list(self.iter_forecasts())
+
+
+    def iter_forecasts(self):
+        """
+        :return: a generator of this Model's Forecasts
+        """
+        return self._iter_resources(self.uri + 'forecasts/', Forecast)
 
 
     def edit(self, model_config):
@@ -482,13 +858,13 @@ class Model(ZoltarResource):
             'abbreviation', 'team_name', 'description', 'contributors', 'license', 'notes', 'citation', 'methods',
             'home_url', 'aux_data_url']
         """
-        response = requests.put(self.uri,
-                                headers={'Authorization': f'JWT {self.zoltar_connection.session.token}'},
-                                json={'model_config': model_config})
+        response = self.zoltar_connection.http.put(self.uri, json={'model_config': model_config})
         if response.status_code != 200:  # HTTP_200_OK
             raise RuntimeError(f"edit(): status code was not 200. status_code={response.status_code}. "
                                f"text={response.text}")
 
+        self.zoltar_connection.invalidate_cache(self.uri)
+
 
     def upload_forecast(self, forecast_json, source, timezero_date, notes=''):
         """
@@ -504,18 +880,48 @@ class Model(ZoltarResource):
         with tempfile.TemporaryFile("r+") as forecast_json_fp:
             json.dump(forecast_json, forecast_json_fp)
             forecast_json_fp.seek(0)
-            response = requests.post(self.uri + 'forecasts/',
-                                     headers={'Authorization': f'JWT {self.zoltar_connection.session.token}'},
-                                     data={'timezero_date': timezero_date, 'notes': notes},
-                                     files={'data_file': (source, forecast_json_fp, 'application/json')})
+            response = self.zoltar_connection.http.post(self.uri + 'forecasts/',
+                                                        data={'timezero_date': timezero_date, 'notes': notes},
+                                                        files={'data_file': (source, forecast_json_fp,
+                                                                             'application/json')})
             if response.status_code != 200:  # HTTP_200_OK
                 raise RuntimeError(f"upload_forecast(): status code was not 200. status_code={response.status_code}. "
                                    f"text={response.text}")
 
+            self.zoltar_connection.invalidate_cache(self.uri + 'forecasts/')
             job_json = response.json()
             return Job(self.zoltar_connection, job_json['url'])
 
 
+    def upload_forecasts_bulk(self, items, max_workers=8):
+        """
+        Uploads multiple forecasts to this model concurrently, sharing the connection's pooled session.
+
+        todo: if Zoltar gains a batch upload endpoint then this should POST to it instead, keeping the same signature
+
+        :param items: a list of `upload_forecast()` arg tuples: (forecast_json, source, timezero_date) or
+            (forecast_json, source, timezero_date, notes)
+        :param max_workers: number of uploads to run at once
+        :return: a list of Jobs to use to track the uploads, in the same order as items
+        :raises BulkUploadError: if any upload failed. every item is still attempted, and the error has the Jobs of
+            those that succeeded
+        """
+        items = list(items)
+        self.zoltar_connection.re_authenticate_if_necessary()  # once up front. later re-auths are serialized
+        with ThreadPoolExecutor(max_workers=min(max_workers, ZoltarConnection.POOL_MAXSIZE)) as executor:
+            futures = [executor.submit(self.upload_forecast, *item) for item in items]
+        jobs, errors = [], {}  # jobs: a Job or None (failed) per item. errors: maps failed item index -> exception
+        for idx, future in enumerate(futures):
+            error = future.exception()
+            jobs.append(None if error else future.result())
+            if error:
+                errors[idx] = error
+        if errors:
+            raise BulkUploadError(items, jobs, errors)
+
+        return jobs
+
+
 class Forecast(ZoltarResource):
     _repr_keys = ('source', 'created_at', 'notes')
 
@@ -550,13 +956,13 @@ class Forecast(ZoltarResource):
 
         :param source:
         """
-        response = requests.put(self.uri,
-                                headers={'Authorization': f'JWT {self.zoltar_connection.session.token}'},
-                                json={'source': source})
+        response = self.zoltar_connection.http.put(self.uri, json={'source': source})
         if response.status_code != 200:  # HTTP_200_OK
             raise RuntimeError(f"set_source(): status code was not 200. status_code={response.status_code}. "
                                f"text={response.text}")
 
+        self.zoltar_connection.invalidate_cache(self.uri)
+
 
     @property
     def created_at(self):
@@ -570,17 +976,67 @@ class Forecast(ZoltarResource):
 
     def data(self):
         """
+        Downloads my data, parsing it as it streams in so that the raw response is never held in memory in full.
+
         :return: this forecast's data as a dict in the "JSON IO dict" format accepted by
             utils.forecast.load_predictions_from_json_io_dict()
         """
-        data_uri = self.json['forecast_data']
-        response = requests.get(data_uri,
-                                headers={'Authorization': 'JWT {}'.format(self.zoltar_connection.session.token)})
+        response = self._data_response()
+        try:
+            return dict(ijson.kvitems(response.raw, '', use_float=True))
+        finally:
+            response.close()
+
+
+    def iter_predictions(self):
+        """
+        A streaming alternative to data() for callers that only need my predictions, e.g., to pass to
+        `csv_io.csv_rows_from_prediction_dicts()`. Unlike data(), the full "JSON IO dict" is never built.
+
+        :return: a generator of the "prediction dicts" in my data's "predictions" list
+        :raises RuntimeError: once the data has been read, if it had no "predictions" section, as
+            `csv_io.csv_rows_from_json_io_dict()` does
+        """
+        response = self._data_response()
+        try:
+            # to tell an empty "predictions" list from a missing one we keep the data read until the first prediction.
+            # if there are none then that's all of it, which is small
+            reader = _RecordingReader(response.raw)
+            for prediction_dict in ijson.items(reader, 'predictions.item', use_float=True):
+                reader.stop()
+                yield prediction_dict
+            if reader.chunks is not None:
+                data_json = _json_loads(b''.join(reader.chunks))
+                if not isinstance(data_json, dict) or ('predictions' not in data_json):
+                    raise RuntimeError("no predictions section found in forecast data")
+        finally:
+            response.close()
+
+
+    def csv_rows_stream(self):
+        """
+        Downloads my data as CSV rows, fusing the streamed download, JSON parsing, and row generation so that memory use
+        is constant regardless of forecast size. For example:
+
+            csv.writer(fp).writerows(forecast.csv_rows_stream())
+
+        :return: a generator of the rows that `csv_io.csv_rows_from_json_io_dict(self.data())` would return,
+            including header
+        """
+        return iter_csv_rows_from_prediction_dicts(self.iter_predictions())
+
+
+    def _data_response(self):
+        """
+        :return: a streamed response for my data, ready for incremental reading from its `raw`
+        """
+        response = self.zoltar_connection.http.get(self.json['forecast_data'], stream=True)
         if response.status_code != 200:  # HTTP_200_OK
             raise RuntimeError(f"data(): status code was not 200. status_code={response.status_code}. "
                                f"text={response.text}")
 
-        return json.loads(response.content.decode('utf-8'))
+        response.raw.decode_content = True  # transparently decompress gzip, etc.
+        return response
 
 
 class Unit(ZoltarResource):
@@ -678,6 +1134,31 @@ class Job(ZoltarResource):
             else super().__repr__()
 
 
+    def wait_until_done(self, poll_interval=2.0, status_callback=None):
+        """
+        Polls my status until the job either succeeds or fails. While my connection's cache is enabled, refresh() uses
+        conditional GETs, so the server only sends my JSON when it has changed. NB: With `cache_ttl=0` nothing is
+        cached, so every poll downloads my full JSON - consider a longer poll_interval.
+
+        :param poll_interval: seconds to sleep between polls
+        :param status_callback: optional function that's passed my status_as_str each time it's checked, including the
+            final one. e.g., to report progress
+        :return: self, once SUCCESS
+        :raises RuntimeError: if the job FAILED or had a TIMEOUT
+        """
+        while True:
+            status = self.status_as_str
+            if status_callback:
+                status_callback(status)
+            if status == 'SUCCESS':
+                return self
+            elif status in ('FAILED', 'TIMEOUT'):
+                raise RuntimeError(f"job failed: job={self}, failure_message={self.json['failure_message']!r}")
+
+            time.sleep(poll_interval)
+            self.refresh()
+
+
     @property
     def input_json(self):
         return self.json['input_json']
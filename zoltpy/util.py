@@ -4,11 +4,9 @@ import json
 import logging
 import os
 import sys
-import time
 from pathlib import Path
 
 import pandas as pd
-import requests
 
 from zoltpy.cdc_io import json_io_dict_from_cdc_csv_file
 from zoltpy.connection import ZoltarConnection, Project
@@ -44,12 +42,11 @@ def create_project(conn, project_json):
 
     # create new project
     logger.info(f"creating new project. project name={project_dict['name']}")
-    response = requests.post(f'{conn.host}/api/projects/',
-                             headers={'Authorization': f'JWT {conn.session.token}'},
-                             json={'project_config': project_dict})
+    response = conn.http.post(f'{conn.host}/api/projects/', json={'project_config': project_dict})
     if response.status_code != 200:  # HTTP_200_OK
         raise RuntimeError(f"status_code was not 200. status_code={response.status_code}, text={response.text}")
 
+    conn.invalidate_cache(f'{conn.host}/api/projects/')
     new_project_json = response.json()
     new_project = Project(conn, new_project_json["url"], new_project_json)
     logger.info(f"created new project: {new_project}")
@@ -255,22 +252,18 @@ def dataframe_from_json_io_dict(json_io_dict):
 
 def busy_poll_job(job):
     """
-    A simple utility that polls job's status every second until either success or failure.
+    A simple utility that polls job's status every second until either success or failure, printing its progress. See
+    `Job.wait_until_done()`.
     """
     print(f"\n* polling for status change. job: {job}")
-    while True:
-        status = job.status_as_str
-        failure_message = job.json["failure_message"]
-        print(f"- {status}")
-        if (status == "FAILED") or (status == "TIMEOUT"):
+    try:
+        job.wait_until_done(poll_interval=1, status_callback=lambda status: print(f"- {status}"))
+    except RuntimeError:
+        status = job.status_as_str  # not a GET: job's JSON is as of the last successful poll
+        if status in ("FAILED", "TIMEOUT"):  # o/w polling itself failed, e.g., a network error
             print(f"x {status}")
-            print("\n", failure_message)
-            raise RuntimeError(f"job failed: job={job}, failure_message={failure_message!r}")
-        if status == "SUCCESS":
-            break
-
-        time.sleep(1)
-        job.refresh()
+            print("\n", job.json["failure_message"])
+        raise
 
 
 def authenticate(env_user="Z_USERNAME", env_pass="Z_PASSWORD"):